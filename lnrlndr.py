@@ -6,16 +6,29 @@ Control the Apollo Lunar Module to safely land on the moon's surface
 
 import pygame
 import math
-import random
+import numpy as np
+from collections import OrderedDict
 from typing import List, Tuple
 
+try:
+    from numba import njit
+except ImportError:  # numba is optional; the physics kernel then runs as plain Python
+    def njit(*args, **kwargs):
+        if args and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
 # Initialize Pygame
 pygame.init()
 
 # Constants
 SCREEN_WIDTH = 800
 SCREEN_HEIGHT = 600
-FPS = 60
+FPS = 60  # Simulation ticks per second; physics constants are tuned per tick
+SIM_DT = 1.0 / FPS
+MAX_RENDER_FPS = 240  # Render cap, so spare frames don't spin the CPU
+MAX_FRAME_TIME = 0.25  # Longest wall-clock gap simulated in one go (seconds)
+IDLE_FRAME_MS = 100  # Frame delay on the static landed/crashed screens (10 Hz)
 
 # Colors (vector graphics style - green on black like classic arcade)
 BLACK = (0, 0, 0)
@@ -31,11 +44,75 @@ THRUST_STEP = 0.01
 ROTATION_SPEED = 3.0
 MAX_LANDING_VELOCITY = 2.0
 MAX_LANDING_ANGLE = 15.0
+LANDING_PAD_Y = SCREEN_HEIGHT - 20  # Ground height of the flat landing pad
 
 # Fuel constants
 INITIAL_FUEL = 500
 FUEL_CONSUMPTION_RATE = 0.5
 
+# Window events after which the last frame must be redrawn
+_REDRAW_EVENTS = (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED, pygame.WINDOWSHOWN, pygame.WINDOWRESTORED)
+
+# Game states
+STATE_PLAYING, STATE_LANDED, STATE_CRASHED = 0, 1, 2
+
+# End-of-game message and color per terminal state
+_STATE_MESSAGES = {
+    STATE_LANDED: ("SUCCESSFUL LANDING!", GREEN),
+    STATE_CRASHED: ("CRASHED!", RED),
+}
+
+# HUD text surfaces kept per field before the least recently used is dropped
+HUD_CACHE_SIZE = 256
+
+# Module-level aliases for math functions used on the per-frame path
+_cos = math.cos
+_sin = math.sin
+_hypot = math.hypot
+_DEG_TO_RAD = math.pi / 180.0
+
+# Apollo LM shape relative to center (0, 0)
+_LANDER_SHAPE = (
+    (0, -12),      # Top point
+    (-8, 0),       # Left middle
+    (-10, 8),      # Left leg
+    (-5, 8),       # Left leg inner
+    (0, 3),        # Bottom center
+    (5, 8),        # Right leg inner
+    (10, 8),       # Right leg
+    (8, 0),        # Right middle
+)
+
+# Flame base vertices; the apex depends on the thrust level
+_FLAME_BASE = ((-3, 8), (3, 8))
+
+
+@njit(cache=True)
+def _physics_step(x, y, vx, vy, sin_a, cos_a, thrust, fuel):
+    """Advance the lander one tick, returning (x, y, vx, vy, fuel, speed)"""
+    # Apply gravity
+    vy += GRAVITY
+    
+    # Apply thrust if fuel available
+    if thrust > 0 and fuel > 0:
+        vx += thrust * sin_a
+        vy -= thrust * cos_a
+        fuel -= thrust * FUEL_CONSUMPTION_RATE
+        if fuel < 0:
+            fuel = 0.0
+    
+    # Update position
+    x += vx
+    y += vy
+    
+    # Check boundaries (wrap horizontally)
+    if x < 0:
+        x = float(SCREEN_WIDTH)
+    elif x > SCREEN_WIDTH:
+        x = 0.0
+    
+    return x, y, vx, vy, fuel, math.hypot(vx, vy)
+
 
 class Lander:
     """Apollo Lunar Module with physics simulation"""
@@ -45,141 +122,150 @@ class Lander:
         self.y = y
         self.vx = 0.0  # Velocity X
         self.vy = 0.0  # Velocity Y
-        self.angle = 0.0  # Angle in degrees (0 = pointing up)
+        self.angle = 0.0  # Angle in degrees (0 = pointing up), not wrapped
         self.thrust = 0.0
         self.fuel = INITIAL_FUEL
         self.crashed = False
         self.landed = False
         self.size = 15
+        self._speed = 0.0  # Cached velocity magnitude, refreshed in update()
+        self._crash_points = None  # Integer wreck vertices, set on first crashed draw
+        
+        # Output buffers reused by get_shape()/get_thruster_points() every frame
+        self._shape_buf = [(0.0, 0.0)] * len(_LANDER_SHAPE)
+        self._flame_buf = [(0.0, 0.0)] * 3
+        
+        # Integer-rounded HUD values, refreshed in update() (thrust also on change)
+        self._alt_disp = 0
+        self._vel_disp = 0.0
+        self._fuel_disp = 0
+        self._thrust_pct = 0
+        self._angle_disp = 0
+        self._refresh_display()
+        
+        # Cached trig for the current angle (recomputed only when it changes)
+        self._cached_angle = None
+        self._cos_a = 1.0
+        self._sin_a = 0.0
+        self._ensure_trig()
+    
+    def _ensure_trig(self):
+        """Refresh cached sin/cos if the angle changed since last call"""
+        if self._cached_angle != self.angle:
+            rad = self.angle * _DEG_TO_RAD
+            self._cos_a = _cos(rad)
+            self._sin_a = _sin(rad)
+            self._cached_angle = self.angle
         
     def get_shape(self) -> List[Tuple[float, float]]:
-        """Return the Apollo LM shape as a list of points (vector graphics)"""
+        """Return the Apollo LM shape as a list of points (vector graphics)
+        
+        The list is reused between calls; copy it if it must outlive the frame.
+        """
         # Apollo Lunar Module shape (simplified)
-        rad = math.radians(self.angle)
-        cos_a = math.cos(rad)
-        sin_a = math.sin(rad)
-        
-        # Define shape relative to center (0, 0)
-        shape = [
-            (0, -12),      # Top point
-            (-8, 0),       # Left middle
-            (-10, 8),      # Left leg
-            (-5, 8),       # Left leg inner
-            (0, 3),        # Bottom center
-            (5, 8),        # Right leg inner
-            (10, 8),       # Right leg
-            (8, 0),        # Right middle
-        ]
-        
-        # Rotate and translate points
-        rotated = []
-        for px, py in shape:
-            rx = px * cos_a - py * sin_a
-            ry = px * sin_a + py * cos_a
-            rotated.append((self.x + rx, self.y + ry))
-        
-        return rotated
+        self._ensure_trig()
+        cos_a = self._cos_a
+        sin_a = self._sin_a
+        x = self.x
+        y = self.y
+        
+        # Rotate and translate points into the reused buffer
+        buf = self._shape_buf
+        for i, (px, py) in enumerate(_LANDER_SHAPE):
+            buf[i] = (x + px * cos_a - py * sin_a, y + px * sin_a + py * cos_a)
+        return buf
     
     def get_thruster_points(self) -> List[Tuple[float, float]]:
-        """Return flame points when thrusting"""
+        """Return flame points when thrusting (reused between calls, like get_shape)"""
         if self.thrust <= 0 or self.fuel <= 0:
             return []
         
-        rad = math.radians(self.angle)
-        cos_a = math.cos(rad)
-        sin_a = math.sin(rad)
+        self._ensure_trig()
+        cos_a = self._cos_a
+        sin_a = self._sin_a
         
         # Flame size based on thrust level
         flame_length = 10 + (self.thrust / MAX_THRUST) * 20
         
-        # Flame shape (triangle)
-        flame = [
-            (-3, 8),
-            (0, 8 + flame_length),
-            (3, 8),
-        ]
-        
-        # Rotate and translate
-        rotated = []
-        for px, py in flame:
-            rx = px * cos_a - py * sin_a
-            ry = px * sin_a + py * cos_a
-            rotated.append((self.x + rx, self.y + ry))
-        
-        return rotated
-    
-    def rotate_left(self):
-        """Rotate lander counter-clockwise"""
-        self.angle -= ROTATION_SPEED
-        if self.angle < 0:
-            self.angle += 360
+        x = self.x
+        y = self.y
+        
+        # Flame shape (triangle): base corners around the apex
+        (lx, ly), (rx, ry) = _FLAME_BASE
+        ay = 8 + flame_length
+        
+        # Rotate and translate into the reused buffer
+        buf = self._flame_buf
+        buf[0] = (x + lx * cos_a - ly * sin_a, y + lx * sin_a + ly * cos_a)
+        buf[1] = (x - ay * sin_a, y + ay * cos_a)
+        buf[2] = (x + rx * cos_a - ry * sin_a, y + rx * sin_a + ry * cos_a)
+        return buf
     
-    def rotate_right(self):
-        """Rotate lander clockwise"""
-        self.angle += ROTATION_SPEED
-        if self.angle >= 360:
-            self.angle -= 360
+    def rotate(self, delta: float):
+        """Rotate lander by delta degrees (positive = clockwise)"""
+        self.angle += delta
     
     def increase_thrust(self):
         """Increase thrust level"""
         if self.fuel > 0:
             self.thrust = min(self.thrust + THRUST_STEP, MAX_THRUST)
+            self._thrust_pct = int((self.thrust / MAX_THRUST) * 100)
     
     def decrease_thrust(self):
         """Decrease thrust level"""
-        self.thrust = max(self.thrust - THRUST_STEP, 0)
+        self.thrust = max(self.thrust - THRUST_STEP, 0.0)
+        self._thrust_pct = int((self.thrust / MAX_THRUST) * 100)
     
     def update(self, terrain: 'Terrain'):
         """Update lander physics"""
         if self.crashed or self.landed:
             return
         
-        # Apply gravity
-        self.vy += GRAVITY
-        
-        # Apply thrust if fuel available
-        if self.thrust > 0 and self.fuel > 0:
-            rad = math.radians(self.angle)
-            self.vx += self.thrust * math.sin(rad)
-            self.vy -= self.thrust * math.cos(rad)
-            self.fuel -= self.thrust * FUEL_CONSUMPTION_RATE
-            if self.fuel < 0:
-                self.fuel = 0
-        
-        # Update position
-        self.x += self.vx
-        self.y += self.vy
-        
-        # Check boundaries (wrap horizontally)
-        if self.x < 0:
-            self.x = SCREEN_WIDTH
-        elif self.x > SCREEN_WIDTH:
-            self.x = 0
+        self._ensure_trig()
+        (self.x, self.y, self.vx, self.vy,
+         self.fuel, self._speed) = _physics_step(float(self.x), float(self.y), self.vx, self.vy,
+                                                 self._sin_a, self._cos_a, self.thrust,
+                                                 float(self.fuel))
         
         # Check collision with terrain
-        if self.y >= SCREEN_HEIGHT - 20:  # Basic ground check
+        if self.y >= terrain.ground_height(self.x):
             self.check_landing(terrain)
         
         # Check if crashed (off screen bottom)
         if self.y > SCREEN_HEIGHT + 50:
             self.crashed = True
+        
+        self._refresh_display()
+    
+    def _refresh_display(self):
+        """Recompute the rounded values shown on the HUD"""
+        self._alt_disp = int(SCREEN_HEIGHT - self.y)
+        self._vel_disp = round(self._speed, 1)
+        self._fuel_disp = int(self.fuel)
+        self._thrust_pct = int((self.thrust / MAX_THRUST) * 100)
+        self._angle_disp = round(self._normalized_angle())
+    
+    def _normalized_angle(self) -> float:
+        """Return the angle wrapped to [-180, 180) degrees"""
+        return ((self.angle + 180.0) % 360.0) - 180.0
     
     def check_landing(self, terrain: 'Terrain'):
         """Check if landing is successful or a crash"""
-        # Get landing pad info
-        landing_zone = terrain.get_landing_zone()
+        # Get the flat part of the landing pad (its edges slope up to the mountains)
+        pad_span = terrain.get_pad_span()
         
-        # Check if over landing pad
-        if landing_zone[0] <= self.x <= landing_zone[1]:
+        # Check if over the landing pad
+        if pad_span[0] <= self.x <= pad_span[1]:
             # Check velocity and angle
-            velocity = math.sqrt(self.vx ** 2 + self.vy ** 2)
-            angle_normalized = self.angle if self.angle <= 180 else self.angle - 360
+            velocity = _hypot(self.vx, self.vy)
+            angle_normalized = self._normalized_angle()
             
             if velocity <= MAX_LANDING_VELOCITY and abs(angle_normalized) <= MAX_LANDING_ANGLE:
                 self.landed = True
                 self.vy = 0
                 self.vx = 0
-                self.y = SCREEN_HEIGHT - 30
+                self._speed = 0.0
+                self.y = LANDING_PAD_Y - 10
             else:
                 self.crashed = True
         else:
@@ -188,10 +274,12 @@ class Lander:
     def draw(self, screen: pygame.Surface):
         """Draw the lander"""
         if self.crashed:
-            # Draw explosion/crash
-            points = self.get_shape()
-            for point in points:
-                pygame.draw.circle(screen, RED, (int(point[0]), int(point[1])), 2)
+            # Draw explosion/crash (the wreck no longer moves, so convert its vertices once)
+            if self._crash_points is None:
+                self._crash_points = [(int(px), int(py)) for px, py in self.get_shape()]
+            circle = pygame.draw.circle
+            for point in self._crash_points:
+                circle(screen, RED, point, 2)
         else:
             # Draw lander body
             points = self.get_shape()
@@ -211,45 +299,74 @@ class Terrain:
         self.points = []
         self.landing_pad_x = 0
         self.landing_pad_width = 80
+        self._landing_pad_x2 = 0
+        self._landing_zone = (0, 0)
+        self._pad_span = (0.0, 0.0)
+        self._xs = np.empty(0)
+        self._ys = np.empty(0, dtype=np.int64)
+        self._ground_y = np.empty(SCREEN_WIDTH, dtype=np.int16)
+        self._runs = []
+        self._bg = None
         self.generate()
     
     def generate(self):
         """Generate random mountainous terrain"""
-        self.points = []
+        rng = np.random.default_rng()
         
         # Randomly place landing pad
-        self.landing_pad_x = random.randint(150, SCREEN_WIDTH - 150)
+        self.landing_pad_x = int(rng.integers(150, SCREEN_WIDTH - 150, endpoint=True))
+        self._landing_pad_x2 = self.landing_pad_x + self.landing_pad_width
+        self._landing_zone = (self.landing_pad_x, self._landing_pad_x2)
         
-        # Generate terrain points
+        # Generate terrain points: random mountainous heights, flat over the landing pad
         num_points = 20
-        for i in range(num_points + 1):
-            x = (SCREEN_WIDTH / num_points) * i
-            
-            # Flat landing pad area
-            if self.landing_pad_x <= x <= self.landing_pad_x + self.landing_pad_width:
-                y = SCREEN_HEIGHT - 20
+        xs = np.arange(num_points + 1) * (SCREEN_WIDTH / num_points)
+        ys = SCREEN_HEIGHT - rng.integers(20, 150, size=num_points + 1, endpoint=True)
+        on_pad = (xs >= self.landing_pad_x) & (xs <= self._landing_pad_x2)
+        ys[on_pad] = LANDING_PAD_Y
+        
+        # Flat part of the pad: between the first and last grid points inside the zone
+        pad_xs = xs[on_pad]
+        self._pad_span = (float(pad_xs[0]), float(pad_xs[-1]))
+        self._xs = xs
+        self._ys = ys
+        self.points = list(zip(xs.tolist(), ys.tolist()))
+        
+        # Rasterize the ground height per pixel column for O(1) collision lookups
+        self._ground_y = np.interp(np.arange(SCREEN_WIDTH), xs, ys).astype(np.int16)
+        
+        # Terrain is static, so group segments into same-colored polylines once
+        # (flat landing pad highlighted) and draw each run with a single call
+        pad_x0, pad_x1 = self._pad_span
+        self._runs = []
+        for i in range(len(self.points) - 1):
+            color = WHITE if pad_x0 <= self.points[i][0] < pad_x1 else GREEN
+            if self._runs and self._runs[-1][0] == color:
+                self._runs[-1][1].append(self.points[i + 1])
             else:
-                # Random mountainous terrain
-                y = SCREEN_HEIGHT - random.randint(20, 150)
-            
-            self.points.append((x, y))
+                self._runs.append((color, [self.points[i], self.points[i + 1]]))
+        
+        # Pre-render the terrain onto a full-screen background surface
+        self._bg = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+        self._bg.fill(BLACK)
+        for color, run in self._runs:
+            pygame.draw.lines(self._bg, color, False, run, 2)
     
     def get_landing_zone(self) -> Tuple[float, float]:
         """Return the x coordinates of the landing pad"""
-        return (self.landing_pad_x, self.landing_pad_x + self.landing_pad_width)
+        return self._landing_zone
+    
+    def ground_height(self, x: float) -> int:
+        """Return the ground y at screen column x (clamped to the screen)"""
+        return int(self._ground_y[min(max(int(x), 0), SCREEN_WIDTH - 1)])
+    
+    def get_pad_span(self) -> Tuple[float, float]:
+        """Return the x coordinates of the flat, landable part of the pad"""
+        return self._pad_span
     
     def draw(self, screen: pygame.Surface):
-        """Draw the terrain"""
-        if len(self.points) < 2:
-            return
-        
-        # Draw terrain lines
-        for i in range(len(self.points) - 1):
-            color = GREEN
-            # Highlight landing pad
-            if self.landing_pad_x <= self.points[i][0] <= self.landing_pad_x + self.landing_pad_width:
-                color = WHITE
-            pygame.draw.line(screen, color, self.points[i], self.points[i + 1], 2)
+        """Draw the terrain (also clears the rest of the screen)"""
+        screen.blit(self._bg, (0, 0))
 
 
 class Game:
@@ -262,14 +379,29 @@ class Game:
         self.font = pygame.font.Font(None, 36)
         self.small_font = pygame.font.Font(None, 24)
         self.running = True
-        self.game_state = "playing"  # playing, landed, crashed
+        
+        # Only queue the events we handle (mouse motion etc. would otherwise flood the queue)
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed([pygame.QUIT, pygame.MOUSEWHEEL, pygame.KEYDOWN, *_REDRAW_EVENTS])
+        
+        # Rendered HUD text, keyed by field then displayed value
+        self._hud_cache = {}
+        self._inst_text = self.small_font.render("← → A D ROTATE | SCROLL THRUST", True, WHITE)
+        
+        # Snapshot of what was last drawn, used to skip redraws of an unchanged frame
+        self._last_drawn_state = None
+        self.game_state = STATE_PLAYING
         
         self.lander = Lander(SCREEN_WIDTH // 2, 50)
         self.terrain = Terrain()
+        
+        # Compile the physics kernel now rather than stalling the first game tick
+        _physics_step(0.0, 0.0, 0.0, 0.0, 0.0, 1.0, 0.0, 0.0)
     
-    def handle_events(self):
-        """Handle input events"""
-        for event in pygame.event.get():
+    def handle_events(self) -> bool:
+        """Handle input events, returning True if any were processed"""
+        events = pygame.event.get()
+        for event in events:
             if event.type == pygame.QUIT:
                 self.running = False
             
@@ -282,33 +414,43 @@ class Game:
             
             # Keyboard for restart
             elif event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_r and self.game_state != "playing":
+                if event.key == pygame.K_r and self.game_state != STATE_PLAYING:
                     self.reset()
+            
+            # Window uncovered/restored: its contents may be lost, so force a redraw
+            elif event.type in _REDRAW_EVENTS:
+                self._last_drawn_state = None
         
         # Continuous key presses for rotation
-        keys = pygame.key.get_pressed()
-        if self.game_state == "playing":
-            if keys[pygame.K_LEFT] or keys[pygame.K_a]:
-                self.lander.rotate_left()
-            if keys[pygame.K_RIGHT] or keys[pygame.K_d]:
-                self.lander.rotate_right()
+        if self.game_state == STATE_PLAYING:
+            keys = pygame.key.get_pressed()
+            left = keys[pygame.K_LEFT] or keys[pygame.K_a]
+            right = keys[pygame.K_RIGHT] or keys[pygame.K_d]
+            if left != right:
+                self.lander.rotate(ROTATION_SPEED if right else -ROTATION_SPEED)
+        
+        return bool(events)
     
     def update(self):
         """Update game state"""
-        if self.game_state == "playing":
+        if self.game_state == STATE_PLAYING:
             self.lander.update(self.terrain)
             
             # Check game state changes
             if self.lander.crashed:
-                self.game_state = "crashed"
+                self.game_state = STATE_CRASHED
             elif self.lander.landed:
-                self.game_state = "landed"
+                self.game_state = STATE_LANDED
     
     def draw(self):
         """Draw everything"""
-        self.screen.fill(BLACK)
+        lander = self.lander
+        frame_state = (self.game_state, self.terrain, lander.x, lander.y, lander.angle,
+                       lander._fuel_disp, lander.thrust)
+        if frame_state == self._last_drawn_state:
+            return
         
-        # Draw terrain
+        # Draw terrain (its background covers the whole screen)
         self.terrain.draw(self.screen)
         
         # Draw lander
@@ -318,44 +460,42 @@ class Game:
         self.draw_hud()
         
         # Draw game state messages
-        if self.game_state == "landed":
-            self.draw_message("SUCCESSFUL LANDING!", GREEN)
-            self.draw_restart_hint()
-        elif self.game_state == "crashed":
-            self.draw_message("CRASHED!", RED)
+        message = _STATE_MESSAGES.get(self.game_state)
+        if message is not None:
+            self.draw_message(*message)
             self.draw_restart_hint()
         
         pygame.display.flip()
+        self._last_drawn_state = frame_state
+    
+    def _hud_text(self, field: str, value, fmt: str) -> pygame.Surface:
+        """Return the rendered HUD text for a field, re-rendering only on value change"""
+        cache = self._hud_cache.get(field)
+        if cache is None:
+            cache = self._hud_cache[field] = OrderedDict()
+        
+        surface = cache.get(value)
+        if surface is None:
+            surface = self.small_font.render(fmt.format(value), True, GREEN)
+            cache[value] = surface
+            if len(cache) > HUD_CACHE_SIZE:
+                cache.popitem(last=False)
+        else:
+            cache.move_to_end(value)
+        return surface
     
     def draw_hud(self):
         """Draw heads-up display"""
-        # Altitude
-        altitude = int(SCREEN_HEIGHT - self.lander.y)
-        alt_text = self.small_font.render(f"ALT: {altitude}", True, GREEN)
-        self.screen.blit(alt_text, (10, 10))
-        
-        # Velocity
-        velocity = math.sqrt(self.lander.vx ** 2 + self.lander.vy ** 2)
-        vel_text = self.small_font.render(f"VEL: {velocity:.1f}", True, GREEN)
-        self.screen.blit(vel_text, (10, 35))
-        
-        # Fuel
-        fuel_text = self.small_font.render(f"FUEL: {int(self.lander.fuel)}", True, GREEN)
-        self.screen.blit(fuel_text, (10, 60))
-        
-        # Thrust level
-        thrust_percent = int((self.lander.thrust / MAX_THRUST) * 100)
-        thrust_text = self.small_font.render(f"THRUST: {thrust_percent}%", True, GREEN)
-        self.screen.blit(thrust_text, (10, 85))
-        
-        # Angle
-        angle_normalized = self.lander.angle if self.lander.angle <= 180 else self.lander.angle - 360
-        angle_text = self.small_font.render(f"ANGLE: {angle_normalized:.0f}°", True, GREEN)
-        self.screen.blit(angle_text, (10, 110))
+        lander = self.lander
+        blit = self.screen.blit
+        blit(self._hud_text("alt", lander._alt_disp, "ALT: {}"), (10, 10))
+        blit(self._hud_text("vel", lander._vel_disp, "VEL: {:.1f}"), (10, 35))
+        blit(self._hud_text("fuel", lander._fuel_disp, "FUEL: {}"), (10, 60))
+        blit(self._hud_text("thrust", lander._thrust_pct, "THRUST: {}%"), (10, 85))
+        blit(self._hud_text("angle", lander._angle_disp, "ANGLE: {}°"), (10, 110))
         
         # Instructions
-        inst_text = self.small_font.render("← → A D ROTATE | SCROLL THRUST", True, WHITE)
-        self.screen.blit(inst_text, (SCREEN_WIDTH - 350, 10))
+        blit(self._inst_text, (SCREEN_WIDTH - 350, 10))
     
     def draw_message(self, text: str, color: Tuple[int, int, int]):
         """Draw centered message"""
@@ -373,15 +513,28 @@ class Game:
         """Reset game"""
         self.lander = Lander(SCREEN_WIDTH // 2, 50)
         self.terrain = Terrain()
-        self.game_state = "playing"
+        self.game_state = STATE_PLAYING
     
     def run(self):
         """Main game loop"""
+        # Fixed-step simulation decoupled from the render rate
+        accum = 0.0
+        self.clock.tick()
         while self.running:
-            self.handle_events()
-            self.update()
+            accum += min(self.clock.tick(MAX_RENDER_FPS) / 1000.0, MAX_FRAME_TIME)
+            had_events = False
+            while accum >= SIM_DT:
+                had_events |= self.handle_events()
+                self.update()
+                accum -= SIM_DT
             self.draw()
-            self.clock.tick(FPS)
+            
+            # Nothing moves on the end screens, so poll for input at a lower rate
+            if self.game_state != STATE_PLAYING and not had_events:
+                pygame.time.wait(IDLE_FRAME_MS)
+                # Don't replay the sleep as catch-up ticks, but still poll input next loop
+                self.clock.tick()
+                accum = SIM_DT
         
         pygame.quit()
 